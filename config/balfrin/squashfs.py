@@ -5,11 +5,11 @@
 #
 # ReFrame CSCS settings
 #
-import json
 import os
 
 import reframe.core.launchers.mpi as mpi
 import reframe.utility.osext as osext
+from reframe.utility import import_module_from_file
 
 
 @mpi.register_launcher('squashfs-run')
@@ -27,8 +27,9 @@ user_env_root = '/mch-environment/v1'
 rfm_prefix = os.path.normpath(
     os.path.join(os.path.abspath(os.path.dirname(__file__)), '..')
 )
-with open(f'{rfm_prefix}/common_logging.json', 'r') as cfg_file:
-    logging_section = json.load(cfg_file)
+logging_section = import_module_from_file(
+    f'{rfm_prefix}/common_logging.py'
+).logging_section
 
 site_configuration = {
     'systems': [
@@ -0,0 +1,14 @@
+# Copyright 2016-2023 Swiss National Supercomputing Centre (CSCS/ETH Zurich)
+# ReFrame Project Developers. See the top-level LICENSE file for details.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# ReFrame CSCS settings
+#
+import json
+import os
+
+
+with open(os.path.join(os.path.dirname(__file__), 'common_logging.json'),
+          'r') as cfg_file:
+    logging_section = json.load(cfg_file)